@@ -46,8 +46,16 @@ def _create_county_commission_elections_long(
         "tier > 2 & is_judicial == False & normalized_position_id in (910,912)"
     )
 
-    county_name_in_position = commissioner_races.apply(
-        lambda row: row.county_name in row.position_name, axis=1
+    # zip the two columns instead of boxing every row with apply(axis=1)
+    county_name_in_position = pd.Series(
+        [
+            county_name in position_name
+            for county_name, position_name in zip(
+                commissioner_races["county_name"], commissioner_races["position_name"]
+            )
+        ],
+        index=commissioner_races.index,
+        dtype=bool,
     )
     # I think ballot ready incorrectly geocoded some races. For example,
     # race_id = 1371024: Benewah, Clearwater, and Nez Perce have elections
@@ -535,7 +535,7 @@ def create_long_format(engine: sa.engine.Engine) -> pd.DataFrame:
     )
     _add_derived_columns(long_format)
     pk = ["source", "project_id", "county_id_fips", "resource_clean"]
-    assert long_format.duplicated(subset=pk).sum() == 0, "Duplicate rows in long format"
+    assert not long_format.duplicated(subset=pk).any(), "Duplicate rows in long format"
     long_format["surrogate_id"] = range(len(long_format))
     return long_format
 
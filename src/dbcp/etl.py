@@ -7,14 +7,16 @@ import pandas as pd
 import sqlalchemy as sa
 
 import dbcp
-from dbcp.constants import FIPS_CODE_VINTAGE
 from dbcp.extract.ncsl_state_permitting import NCSLScraper
 from dbcp.helpers import enforce_dtypes, psql_insert_copy
 from dbcp.metadata.data_warehouse import metadata
 from dbcp.transform.fips_tables import SPATIAL_CACHE
-from dbcp.transform.helpers import GEOCODER_CACHE, bedford_addfips_fix
+from dbcp.transform.helpers import (
+    GEOCODER_CACHE,
+    add_fips_ids_to_unique_locations,
+    bedford_addfips_fix,
+)
 from dbcp.validation.tests import validate_warehouse
-from pudl.helpers import add_fips_ids as _add_fips_ids
 from pudl.output.pudltabl import PudlTabl
 
 logger = logging.getLogger(__name__)
@@ -81,10 +83,13 @@ def etl_pudl_tables() -> Dict[str, pd.DataFrame]:
     filled_location = mcoe.loc[:, ["state", "county"]].fillna(
         ""
     )  # copy; don't want to fill actual table
-    fips = _add_fips_ids(filled_location, vintage=FIPS_CODE_VINTAGE)
-    mcoe = pd.concat(
-        [mcoe, fips[["state_id_fips", "county_id_fips"]]], axis=1, copy=False
+    # generators share plant locations, so look up each state/county pair once
+    fips = add_fips_ids_to_unique_locations(
+        filled_location, state_col="state", county_col="county"
     )
+    # assign columns instead of concatenating so the rest of mcoe isn't rebuilt
+    mcoe["state_id_fips"] = fips["state_id_fips"]
+    mcoe["county_id_fips"] = fips["county_id_fips"]
     mcoe = mcoe.convert_dtypes()
     pudl_tables["mcoe"] = mcoe
 
@@ -24,6 +24,7 @@ class ColumbiaDocxParser(object):
         "New Restrictions (Post-March 2022 Developments)",
         "New Entries (Post-March 2022 Updates)",
     }
+    VALUE_STYLES = {"Normal", "List Paragraph", "Normal1"}
     FIRST_STATE = "Alabama"
     NULL_STATE_POLICY = {
         "No restrictive state laws, regulations, or policies were found at this time."
@@ -56,6 +57,13 @@ class ColumbiaDocxParser(object):
             "project_name": [],
             "description": [],
         }
+        # map each heading 2 section (or "" for state level notes) to its parser
+        self._section_parsers = {
+            "": self._parse_state_note,
+            "State-Level Restrictions": self._parse_state_policy,
+            "Local Restrictions": self._parse_local_ordinance,
+            "Contested Projects": self._parse_contested_project,
+        }
 
     def load_docx(
         self, source_path=Path("/app/data/raw/RELDI report updated 9.10.21 (1).docx")
@@ -86,57 +94,60 @@ class ColumbiaDocxParser(object):
                 return paragraphs[idx:]
         raise ValueError("Could not find starting state")
 
-    def _parse_values(self, text: str) -> None:
-        """Parse and assign values to the correct dataset based on the current hierarchical headings.
+    def _parse_state_note(self, text: str) -> None:
+        # no null check required. This section is simply missing if null.
+        self.state_notes_dict["state"].append(self.current_state)
+        self.state_notes_dict["notes"].append(text)
 
-        Args:
-            text (str): the paragraph text content
-        """
-        if self.current_header == "":  # state level notes
-            # no null check required. This section is simply missing if null.
-            self.state_notes_dict["state"].append(self.current_state)
-            self.state_notes_dict["notes"].append(text)
+    def _parse_state_policy(self, text: str) -> None:
+        if text in ColumbiaDocxParser.NULL_STATE_POLICY:
             return
-        elif self.current_header == "State-Level Restrictions":
-            if text in ColumbiaDocxParser.NULL_STATE_POLICY:
-                return
-            self.state_policy_dict["state"].append(self.current_state)
-            self.state_policy_dict["policy"].append(text)
+        self.state_policy_dict["state"].append(self.current_state)
+        self.state_policy_dict["policy"].append(text)
+
+    def _parse_local_ordinance(self, text: str) -> None:
+        if text in ColumbiaDocxParser.NULL_ORDINANCE:
             return
+        locality, sep, ordinance = text.partition(":")
+        if not sep:
+            raise ValueError(
+                f"Expected 'locality: ordinance' in {self.current_state}: {text}"
+            )
+        # Brownsville and Benbrook TX have an extra level of hierarchy.
+        if locality in {"Wind", "Solar"}:
+            locality = self.previous_locality
+            ordinance = self.previous_ordinance + ordinance
+        else:
+            self.previous_locality = locality
+            self.previous_ordinance = ordinance
 
-        elif self.current_header == "Local Restrictions":
-            if text in ColumbiaDocxParser.NULL_ORDINANCE:
-                return
-            locality, ordinance = text.split(":", maxsplit=1)
-            # Brownsville and Benbrook TX have an extra level of hierarchy.
-            if locality in {"Wind", "Solar"}:
-                locality = self.previous_locality
-                ordinance = self.previous_ordinance + ordinance
-            else:
-                self.previous_locality = locality
-                self.previous_ordinance = ordinance
+        self.local_ordinance_dict["state"].append(self.current_state)
+        self.local_ordinance_dict["locality"].append(locality)
+        self.local_ordinance_dict["ordinance_text"].append(ordinance.strip())
 
-            self.local_ordinance_dict["state"].append(self.current_state)
-            self.local_ordinance_dict["locality"].append(locality)
-            self.local_ordinance_dict["ordinance_text"].append(ordinance.strip())
+    def _parse_contested_project(self, text: str) -> None:
+        if text in ColumbiaDocxParser.NULL_PROJECT:
             return
+        name, sep, description = text.partition(":")
+        if not sep:  # no project name
+            name, description = "", text
+        self.contested_projects_dict["state"].append(self.current_state)
+        self.contested_projects_dict["project_name"].append(name)
+        self.contested_projects_dict["description"].append(description.strip())
 
-        elif self.current_header == "Contested Projects":
-            if text in ColumbiaDocxParser.NULL_PROJECT:
-                return
-            try:
-                name, description = text.split(":", maxsplit=1)
-            except ValueError:  # no split
-                name = ""
-                description = text
-            self.contested_projects_dict["state"].append(self.current_state)
-            self.contested_projects_dict["project_name"].append(name)
-            self.contested_projects_dict["description"].append(description.strip())
-            return
-        else:
+    def _parse_values(self, text: str) -> None:
+        """Parse and assign values to the correct dataset based on the current hierarchical headings.
+
+        Args:
+            text (str): the paragraph text content
+        """
+        try:
+            parse = self._section_parsers[self.current_header]
+        except KeyError:
             raise ValueError(
                 f"Unexpected header in {self.current_state}: {self.current_header}"
             )
+        parse(text)
 
     def extract(self) -> Dict[str, pd.DataFrame]:
         """Parse the text of the Columbia Local Opposition docx file into tabular dataframes.
@@ -154,38 +165,37 @@ class ColumbiaDocxParser(object):
         paragraphs = self._remove_intro(self.doc.paragraphs)
 
         for paragraph in paragraphs:
-            if paragraph.text == "":  # skip blank lines
+            # python-docx rebuilds .text from the XML runs and looks up .style on
+            # every access, so read each once per paragraph
+            raw_text = paragraph.text
+            if raw_text == "":  # skip blank lines
                 continue
-            elif paragraph.style.name == "Heading 1":  # states
-                self.current_state = paragraph.text.strip()
+            text = raw_text.strip()
+            style = paragraph.style.name
+            if style == "Heading 1":  # states
+                self.current_state = text
                 assert (
                     self.current_state in ColumbiaDocxParser.POSSIBLE_STATES
                 ), f"Unexepected state: {self.current_state}"
                 self.current_header = (
                     ""  # a new state marks a new hierarchy, so reset cache
                 )
-            elif paragraph.style.name == "Heading 2":  # value type
-                self.current_header = paragraph.text.strip()
+            elif style == "Heading 2":  # value type
+                self.current_header = text
                 assert (
                     self.current_header in ColumbiaDocxParser.POSSIBLE_HEADERS
                 ), f"Unexpected header in {self.current_state}: {self.current_header}"
-            elif (
-                paragraph.style.name == "Heading 3"
-            ):  # nearly meaningless subheading. skip.
+            elif style == "Heading 3":  # nearly meaningless subheading. skip.
                 assert (
-                    paragraph.text.strip() in ColumbiaDocxParser.POSSIBLE_SUBHEADINGS
-                ), f"Unexpected subheading in {self.current_state}: {paragraph.text.strip()}"
+                    text in ColumbiaDocxParser.POSSIBLE_SUBHEADINGS
+                ), f"Unexpected subheading in {self.current_state}: {text}"
                 continue
-            elif paragraph.style.name in {
-                "Normal",
-                "List Paragraph",
-                "Normal1",
-            }:  # values
+            elif style in ColumbiaDocxParser.VALUE_STYLES:  # values
                 # This hardcoded style checking is brittle. If the docx changes, this will break.
-                self._parse_values(paragraph.text.strip())
+                self._parse_values(text)
             else:
                 raise ValueError(
-                    f"Unexpected paragraph style in {self.current_state}: {paragraph.style.name}"
+                    f"Unexpected paragraph style in {self.current_state}: {style}"
                 )
 
         output = {
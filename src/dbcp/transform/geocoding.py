@@ -22,22 +22,27 @@ class GoogleGeocoder(object):
     TOWN_LABEL = "administrative_area_level_3"
     STREET_LABELS = {"street_number", "route"}
 
-    def __init__(self, key=None) -> None:
-        """Initialize a GoogleGeocoder object."""
-        if key is None:
-            try:
-                key = os.environ["API_KEY_GOOGLE_MAPS"]
-            except ValueError as e:
-                if "google.com" in e.args[0]:
-                    # local.env wasn't updated properly
-                    raise ValueError(
-                        "API_KEY_GOOGLE_MAPS must be defined in your local.env file."
-                        " See README.md for instructions."
-                    )
-                else:
-                    raise e
-
-        self.client = googlemaps.Client(key=key)
+    def __init__(self, key=None, client: Optional[googlemaps.Client] = None) -> None:
+        """Initialize a GoogleGeocoder object.
+
+        Pass an existing client to share its connection pool and rate limiter.
+        """
+        if client is None:
+            if key is None:
+                try:
+                    key = os.environ["API_KEY_GOOGLE_MAPS"]
+                except ValueError as e:
+                    if "google.com" in e.args[0]:
+                        # local.env wasn't updated properly
+                        raise ValueError(
+                            "API_KEY_GOOGLE_MAPS must be defined in your local.env file."
+                            " See README.md for instructions."
+                        )
+                    else:
+                        raise e
+            client = googlemaps.Client(key=key)
+
+        self.client = client
         self._clear_cache()
         return
 
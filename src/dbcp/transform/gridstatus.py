@@ -733,12 +733,13 @@ def _normalize_project_locations(iso_df: pd.DataFrame) -> pd.DataFrame:
     ] = "51019"  # https://www.ddorn.net/data/FIPS_County_Code_Changes.pdf
 
     geocoded_locations = geocoded_locations[location_cols].copy()
-    duplicate_locations = geocoded_locations[
-        geocoded_locations[["county_id_fips", "project_id"]].duplicated(keep=False)
-    ]
+    is_duplicate = geocoded_locations[["county_id_fips", "project_id"]].duplicated(
+        keep=False
+    )
+    # only slice out the duplicates for the error message
     assert (
-        len(duplicate_locations) < 30
-    ), f"Found more duplicate locations in Grid Status location table than expected:\n {duplicate_locations}"
+        is_duplicate.sum() < 30
+    ), f"Found more duplicate locations in Grid Status location table than expected:\n {geocoded_locations[is_duplicate]}"
     return geocoded_locations
 
 
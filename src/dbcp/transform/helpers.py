@@ -1,6 +1,9 @@
 """Common transform operations."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import pandas as pd
 from joblib import Memory
@@ -27,6 +30,10 @@ except AssertionError:  # local path
 # cache needs to be accessed outside this module to call .clear()
 # limit cache size to 100 KB, keeps most recently accessed first
 GEOCODER_CACHE = Memory(location=geocoder_local_cache, bytes_limit=2**19)
+# concurrent geocoding requests per _geocode_locality call. Keep this well under the
+# googlemaps client's queries_per_second: its throttle isn't thread safe, so
+# concurrent requests can overshoot it by up to this many.
+_GEOCODER_MAX_WORKERS = 8
 
 
 def normalize_multicolumns_to_rows(
@@ -281,25 +288,94 @@ def _geocode_locality(
     # Because the entire input dataframe must be identical to the cached version, I
     # recommend subsetting the dataframe to only state_col and locality_col when calling
     # this function. That allows other, unrelated columns to change but still use the geocode cache.
-    geocoder = GoogleGeocoder()
-    new_cols = state_locality_df.apply(
-        _geocode_row,
-        axis=1,
-        result_type="expand",
-        client=geocoder,
-        state_col=state_col,
-        locality_col=locality_col,
+    # The requests are network bound, so issue them concurrently. GoogleGeocoder is
+    # stateful, so each worker thread gets its own, but they all share one
+    # googlemaps client and its connection pool. The client retries with
+    # exponential backoff when over the query limit. Callers should not
+    # run this function concurrently: each call has its own client and pool.
+    client = GoogleGeocoder().client
+    thread_local = threading.local()
+
+    def geocode_row(row: pd.Series) -> List[str]:
+        if not hasattr(thread_local, "geocoder"):
+            thread_local.geocoder = GoogleGeocoder(client=client)
+        return _geocode_row(
+            row,
+            client=thread_local.geocoder,
+            state_col=state_col,
+            locality_col=locality_col,
+        )
+
+    rows = (row for _, row in state_locality_df.iterrows())
+    with ThreadPoolExecutor(max_workers=_GEOCODER_MAX_WORKERS) as executor:
+        results = list(executor.map(geocode_row, rows))
+    new_cols = pd.DataFrame(
+        results,
+        index=state_locality_df.index,
+        columns=[
+            "geocoded_locality_name",
+            "geocoded_locality_type",
+            "geocoded_containing_county",
+        ],
     )
-    new_cols.columns = [
-        "geocoded_locality_name",
-        "geocoded_locality_type",
-        "geocoded_containing_county",
-    ]
     return new_cols
 
 
+def _apply_to_unique_rows(
+    df: pd.DataFrame, keys: List[str], func: Callable[[pd.DataFrame], pd.DataFrame]
+) -> pd.DataFrame:
+    """Compute new columns once per unique combination of keys and broadcast them to every row.
+
+    Args:
+        df (pd.DataFrame): dataframe containing the key columns
+        keys (List[str]): names of the columns that determine the result
+        func (Callable[[pd.DataFrame], pd.DataFrame]): takes the unique key rows and returns only the new columns, on the same index
+
+    Returns:
+        pd.DataFrame: the new columns, aligned to df.index
+    """
+    unique = df.loc[:, keys].drop_duplicates()
+    new_cols = func(unique)
+    # select the keys again in case func added columns to its input
+    lookup = pd.concat([unique.loc[:, keys], new_cols], axis=1)
+    out = (
+        df.loc[:, keys]
+        .merge(lookup, on=keys, how="left", validate="many_to_one")
+        .drop(columns=keys)
+    )
+    out.index = df.index
+    return out
+
+
+def add_fips_ids_to_unique_locations(
+    df: pd.DataFrame, state_col: str, county_col: str
+) -> pd.DataFrame:
+    """Add state and county FIPS codes, looking up each unique state/county pair once.
+
+    pudl's add_fips_ids does a row-by-row addfips lookup, and most datasets repeat
+    the same locations many times. Like add_fips_ids, the state and county columns
+    are returned as pd.StringDtype().
+    """
+    fips_cols = ["state_id_fips", "county_id_fips"]
+
+    def lookup_fips(locations: pd.DataFrame) -> pd.DataFrame:
+        return _add_fips_ids(
+            locations,
+            state_col=state_col,
+            county_col=county_col,
+            vintage=FIPS_CODE_VINTAGE,
+        ).loc[:, fips_cols]
+
+    fips = _apply_to_unique_rows(df, keys=[state_col, county_col], func=lookup_fips)
+    out = pd.concat([df.drop(columns=fips_cols, errors="ignore"), fips], axis=1)
+    return out.astype({state_col: pd.StringDtype(), county_col: pd.StringDtype()})
+
+
 def add_county_fips_with_backup_geocoding(
-    state_locality_df: pd.DataFrame, state_col="state", locality_col="county"
+    state_locality_df: pd.DataFrame,
+    state_col="state",
+    locality_col="county",
+    fallback_locality_col: Optional[str] = None,
 ) -> pd.DataFrame:
     """Add state and county FIPS codes to a DataFrame with state and locality columns.
 
@@ -310,20 +386,50 @@ def add_county_fips_with_backup_geocoding(
         state_locality_df (pd.DataFrame): dataframe with state and locality columns
         state_col (str, optional): name of the column of state names. Defaults to 'state'.
         locality_col (str, optional): name of the column of locality names. Defaults to 'county'.
+        fallback_locality_col (Optional[str], optional): name of a second column of locality names, used to fill rows whose locality_col lookup still has no county FIPS. Defaults to None.
 
     Returns:
         pd.DataFrame: copy of state_locality_df with new columns 'geocoded_locality_name', 'geocoded_locality_type', 'geocoded_containing_county'
     """
+    out = _add_county_fips_with_backup_geocoding(
+        state_locality_df, state_col=state_col, locality_col=locality_col
+    )
+    if fallback_locality_col is None:
+        return out
+    nan_fips = out.loc[:, "county_id_fips"].isna()
+    if not nan_fips.any():
+        return out
+
+    # only look up the fallback names for rows the first pass couldn't resolve
+    fallback = _add_county_fips_with_backup_geocoding(
+        state_locality_df.loc[nan_fips, [state_col, fallback_locality_col]],
+        state_col=state_col,
+        locality_col=fallback_locality_col,
+    )
+    cols_to_fill = [
+        "county_id_fips",
+        "geocoded_locality_name",
+        "geocoded_locality_type",
+        "geocoded_containing_county",
+    ]
+    # fill cell by cell: where the fallback is also NaN, keep the first pass values
+    out.loc[nan_fips, cols_to_fill] = fallback.loc[:, cols_to_fill].combine_first(
+        out.loc[nan_fips, cols_to_fill]
+    )
+    return out
+
+
+def _add_county_fips_with_backup_geocoding(
+    state_locality_df: pd.DataFrame, state_col="state", locality_col="county"
+) -> pd.DataFrame:
+    """Single pass of add_county_fips_with_backup_geocoding on one locality column."""
     filled_state_locality = state_locality_df.loc[:, [state_col, locality_col]].fillna(
         ""
     )  # copy
     # first try a simple FIPS lookup and split by valid/invalid fips codes
     # The only purpose of this step is to save API calls on the easy ones (most of them)
-    with_fips = _add_fips_ids(
-        filled_state_locality,
-        state_col=state_col,
-        county_col=locality_col,
-        vintage=FIPS_CODE_VINTAGE,
+    with_fips = add_fips_ids_to_unique_locations(
+        filled_state_locality, state_col=state_col, county_col=locality_col
     )
     fips_is_nan = with_fips.loc[:, "county_id_fips"].isna()
     if not fips_is_nan.any():
@@ -341,20 +447,19 @@ def add_county_fips_with_backup_geocoding(
 
     # geocode the lookup failures - they are often city/town names (instead of counties) or simply mis-spelled
     nan_fips = with_fips.loc[fips_is_nan, :].copy()
-    geocoded = _geocode_locality(
-        nan_fips.loc[:, [state_col, locality_col]],
-        # pass subset to _geocode_locality to maximize chance of a cache hit
-        # (this way other columns can change but caching still works)
-        state_col=state_col,
-        locality_col=locality_col,
+    # many rows can share a failed lookup, so geocode each unique location once.
+    # Only the state and locality columns are passed to _geocode_locality, which
+    # maximizes the chance of a cache hit (other columns can change but caching
+    # still works)
+    geocoded = _apply_to_unique_rows(
+        nan_fips,
+        keys=[state_col, locality_col],
+        func=partial(_geocode_locality, state_col=state_col, locality_col=locality_col),
     )
     nan_fips = pd.concat([nan_fips, geocoded], axis=1)
     # add fips using geocoded names
-    filled_fips = _add_fips_ids(
-        nan_fips,
-        state_col=state_col,
-        county_col="geocoded_containing_county",
-        vintage=FIPS_CODE_VINTAGE,
+    filled_fips = add_fips_ids_to_unique_locations(
+        nan_fips, state_col=state_col, county_col="geocoded_containing_county"
     )
 
     # recombine and restore row order
@@ -145,9 +145,9 @@ def transform(raw_dfs: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
 
 
 def _validate_ordinances(ordn: pd.DataFrame) -> None:
-    assert (
-        ordn.duplicated(subset=["raw_state_name", "raw_locality_name"]).sum() == 0
-    ), "Duplicate ordinance locations."
+    assert not ordn.duplicated(
+        subset=["raw_state_name", "raw_locality_name"]
+    ).any(), "Duplicate ordinance locations."
     assert ordn["county_id_fips"].isna().sum() == 0, "Missing FIPS codes."
     assert (
         ordn["geocoded_locality_name"].str.contains(r"[0-9]", regex=True).sum() == 0
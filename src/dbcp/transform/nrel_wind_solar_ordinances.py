@@ -34,19 +34,91 @@ by same project developer if project is less than 40 acres in size". It is possi
 make sparse fields for all those conditions but is beyond the scope of this data model.
 """
 
-from functools import partial, reduce
-from operator import or_
-from typing import Sequence, Union
+import re
+from functools import partial
+from typing import Any, Callable, Sequence, Union
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import root_scalar
 
 # from dbcp.schemas import TABLE_SCHEMAS
 from dbcp.transform.helpers import add_county_fips_with_backup_geocoding
 
 FEET_TO_METERS = 12 * 2.54 / 100
 
+# discrete multivalue delimiter: "/"
+# continuous multivalue delimiter: "-"
+_MULTIVAL_RE = re.compile(r"/|-")
+_PLUS_RE = re.compile(r"\+")
+# capture A, b and the unit from "1.5 + 22.86 meters"
+_LINEAR_RE = re.compile(
+    r"(?P<multiplier>\d\.?\d*) ?\+ ?(?P<offset>\d+\.?\d*)\s?(?P<unit>\w*)"
+)
+# free text columns, cast to the nullable string dtype that enforce_dtypes uses.
+# Casting the pass-through columns too keeps wind and solar dtypes identical, so
+# concatenating them doesn't fall back to object for columns that Excel inferred
+# differently.
+_RAW_TEXT_COLS = [
+    "raw_state_name",
+    "raw_town_name",
+    "raw_county_name",
+    "raw_ordinance_type",
+    "raw_units",
+    "raw_citation",
+    "raw_comment",
+    "raw_updated_unit",
+    "raw_updated_comment",
+    "update_status",
+]
+_LOCALITY_COLS = ["raw_state_name", "raw_town_name", "raw_county_name"]
+_LOWER_IS_WORSE_UNITS = frozenset({"dba"})  # sound restrictions
+_HIGHER_IS_WORSE_UNITS = frozenset({"meters"})  # setbacks
+_WIND_WATER_TOKENS = frozenset({"river", "lake", "creek", "reservoir"})
+_SOLAR_WATER_TOKENS = frozenset({"river", "lake", "wetland", "waters"})
+
+_WIND_TYPE_MAP = {
+    "tower density": "density",
+    "tower denisty": "density",
+    "highway": "highways",
+    "highway 111": "highways",
+    "moratorium": "banned",
+    "maximum installation size": "maximum capacity",
+    "maximum instillation size": "maximum capacity",
+    "total installation": "total turbines",
+    "oil & gas pipeline": "oil & gas pipelines",
+    "noise": "sound",
+    "property": "property line",
+}
+_SOLAR_TYPE_MAP = {
+    "highway": "highways",
+    "lankford highway": "highways",
+    "m.d. route 413": "highways",
+    "u.s. route 13": "highways",
+    "road": "roads",
+    "sounds": "sound",
+    "noise": "sound",
+    "property lines": "property line",
+    "mimimum lot size": "minimum lot size",
+    "moratorium": "banned",
+    "total installation": "total installation size",
+    "property": "property line",
+    "coverage": "maximum lot coverage",
+}
+_WIND_UNIT_MAP = {
+    "meter": "meters",
+    "turbine count": "turbines",
+    "rotor diameter mutliplier": "rotor diameter multiplier",
+    "max tip height": "max tip height multiplier",
+    "rotor diameter": "rotor diameter multiplier",
+    "rotor radius": "rotor radius multiplier",
+}
+_SOLAR_UNIT_MAP = {
+    "meter": "meters",
+    "megawatt": "megawatts",
+    "n/a": np.nan,
+    "maximum structure height": "maximum structure height multiplier",
+}
+
 
 def _format_column_names(cols: Union[pd.Index, Sequence[str]]) -> list[str]:
     out = [(col.lower().replace(" ", "_").replace("/", "_or_")) for col in cols]
@@ -54,47 +126,45 @@ def _format_column_names(cols: Union[pd.Index, Sequence[str]]) -> list[str]:
 
 
 def _convert_multivalued_to_extreme_value(
-    values: pd.Series, use_minimum=True, split_char="/|-"
+    split: pd.DataFrame, use_minimum: pd.Series
 ) -> pd.Series:
-    # discrete multivalue delimiter: "/"
-    # continuous multivalue delimiter: "-"
-    split = values.str.split(split_char, expand=True).apply(pd.to_numeric, axis=1)
-    if use_minimum:
-        extreme = split.min(axis=1)
-    else:
-        extreme = split.max(axis=1)
-    return extreme  # type: ignore
+    numeric = split.apply(pd.to_numeric).to_numpy(  # column-wise
+        dtype=np.float64, na_value=np.nan
+    )
+    use_minimum = use_minimum.to_numpy(dtype=bool)
+    # reduce each row only in the direction it needs
+    extreme = np.empty(len(numeric), dtype=np.float64)
+    extreme[use_minimum] = np.nanmin(numeric[use_minimum], axis=1)
+    extreme[~use_minimum] = np.nanmax(numeric[~use_minimum], axis=1)
+    return pd.Series(extreme, index=split.index)
 
 
 def _replace_multivalued_with_worst_case(
     values: pd.Series, value_types: pd.Series
-) -> None:
+) -> pd.Series:
     # currently assumes all multivalued entries are marked with either "/" or "-"
     # Will raise error if any other values fail to convert to numeric.
-    is_multivalued = values.str.contains("/|-").fillna(False)
-    lower_is_worse = (
-        value_types.str.lower().str.contains("dba").fillna(False)
-    )  # sound restrictions
-    higher_is_worse = (
-        value_types.str.lower().str.contains("meters").fillna(False)
-    )  # setbacks
+    # split once and reuse it to both detect and reduce multivalued entries
+    split = values.str.split(_MULTIVAL_RE, expand=True)
+    if split.shape[1] < 2:  # nothing was split, or values is empty
+        return values
+    # any entry with more than one part has a second part
+    is_multivalued = split[1].notna()
+    # value_types are already simplified to lowercase canonical units
+    lower_is_worse = value_types.isin(_LOWER_IS_WORSE_UNITS)
+    higher_is_worse = value_types.isin(_HIGHER_IS_WORSE_UNITS)
     replace_with_min = is_multivalued & lower_is_worse
     replace_with_max = is_multivalued & higher_is_worse
     err_msg = "Assumption violation: expected all multivalued types to be either dBA or meters."
     assert (
         replace_with_min.sum() + replace_with_max.sum() == is_multivalued.sum()
     ), err_msg
-    replacements = pd.concat(
-        [
-            _convert_multivalued_to_extreme_value(values.loc[replace_with_min]),
-            _convert_multivalued_to_extreme_value(
-                values.loc[replace_with_max], use_minimum=False
-            ),
-        ],
-        axis=0,
+    replacements = _convert_multivalued_to_extreme_value(
+        split.loc[is_multivalued], use_minimum=replace_with_min.loc[is_multivalued]
     )
-    values.update(replacements.astype(values.dtype))
-    return
+    out = values.copy()
+    out.loc[is_multivalued] = replacements.astype(values.dtype)
+    return out
 
 
 def _convert_linear_expr_to_constant(values: pd.Series, x_meters=151.0) -> pd.Series:
@@ -105,112 +175,90 @@ def _convert_linear_expr_to_constant(values: pd.Series, x_meters=151.0) -> pd.Se
     over 500 feet have to meet additional regulatory requirements, so most turbines are intentionally
     built just shorter than this (at least as of 2019 when I was in the industry).
     """
-    pattern = r"(?P<multiplier>\d\.?\d*) ?\+ ?(?P<offset>\d+\.?\d*)\s?(?P<unit>\w*)"  # capture A, b and the unit from "1.5 + 22.86 meters"
-    expr_df = values.str.extract(pattern, expand=True)
-    for col in ["multiplier", "offset"]:
-        expr_df.loc[:, col] = pd.to_numeric(expr_df.loc[:, col])
+    expr_df = values.str.extract(_LINEAR_RE, expand=True)
+    multiplier, offset = (
+        pd.to_numeric(expr_df[col]).to_numpy(dtype=np.float64, na_value=np.nan)
+        for col in ["multiplier", "offset"]
+    )
     # unit conversion: feet to meters
-    expr_df.loc[:, "offset"] = expr_df.loc[:, "offset"].where(
-        expr_df.loc[:, "unit"].str.lower().eq("meters"),
-        expr_df.loc[:, "offset"] * FEET_TO_METERS,
+    is_meters = (
+        np.char.lower(expr_df["unit"].to_numpy(dtype=object).astype(str)) == "meters"
     )
-    constant = expr_df["multiplier"] * x_meters + expr_df["offset"]
+    offset = np.where(is_meters, offset, offset * FEET_TO_METERS)
+    constant = pd.Series(multiplier * x_meters + offset, index=values.index)
     return constant
 
 
 def _replace_linear_definitions_with_constants(
     values: pd.Series, value_types: pd.Series, new_type="meters"
-) -> None:
-    is_linear = values.str.contains(r"\+", regex=True).fillna(False)
+) -> tuple[pd.Series, pd.Series]:
+    is_linear = values.str.contains(_PLUS_RE).fillna(False)
+    if not is_linear.any():
+        return values, value_types
     err_msg = "Assumption violation: expected all linear setbacks to be defined in terms of max tip height."
     assert value_types.loc[is_linear].eq("max tip height multiplier").all(), err_msg
     replacements = _convert_linear_expr_to_constant(values.loc[is_linear])
-    values.update(replacements.astype(values.dtype))
-    value_types.loc[is_linear] = new_type
-    return
+    new_values = values.copy()
+    new_values.loc[is_linear] = replacements.astype(values.dtype)
+    new_types = value_types.copy()
+    new_types.loc[is_linear] = new_type
+    return new_values, new_types
 
 
-def _simplify_wind_ordinance_types(types: pd.Series) -> pd.Series:
-    simple = types.str.lower().str.strip()
+def _map_categories(ser: pd.Series, func: Callable[[str], Any]) -> pd.Series:
+    """Apply func to the unique categories rather than every row. NaN is passed through."""
+    return ser.astype("category").map(func).astype(object)
 
-    is_water = simple.str.contains("river|lake|creek|reservoir")
-    simple.loc[is_water] = "water"
 
-    simple.replace(
-        {
-            "tower density": "density",
-            "tower denisty": "density",
-            "highway": "highways",
-            "highway 111": "highways",
-            "moratorium": "banned",
-            "maximum installation size": "maximum capacity",
-            "maximum instillation size": "maximum capacity",
-            "total installation": "total turbines",
-            "oil & gas pipeline": "oil & gas pipelines",
-            "noise": "sound",
-            "property": "property line",
-        },
-        inplace=True,
-    )
-    return simple
+def _strip_categories(ser: pd.Series) -> pd.Series:
+    """Strip whitespace from the unique values rather than every row."""
+    return ser.astype("category").map(str.strip).astype(ser.dtype)
 
 
-def _simplify_solar_ordinance_types(types: pd.Series) -> pd.Series:
-    simple = types.str.lower().str.strip()
+def _simplify_ordinance_type(
+    raw_type: str, *, water_tokens: frozenset[str], type_map: dict[str, str]
+) -> str:
+    simple = raw_type.lower().strip()
+    if any(token in simple for token in water_tokens):
+        return "water"
+    return type_map.get(simple, simple)
 
-    is_water = simple.str.contains("river|lake|wetland|waters")
-    simple.loc[is_water] = "water"
 
-    simple.replace(
-        {
-            "highway": "highways",
-            "lankford highway": "highways",
-            "m.d. route 413": "highways",
-            "u.s. route 13": "highways",
-            "road": "roads",
-            "sounds": "sound",
-            "noise": "sound",
-            "property lines": "property line",
-            "mimimum lot size": "minimum lot size",
-            "moratorium": "banned",
-            "total installation": "total installation size",
-            "noise": "sound",
-            "property": "property line",
-            "coverage": "maximum lot coverage",
-        },
-        inplace=True,
+def _simplify_unit(
+    raw_unit: str, *, unit_map: dict[str, Any], replace_hyphens=False
+) -> Any:
+    simple = raw_unit.lower().strip()
+    if replace_hyphens:
+        simple = simple.replace("-", " ")
+    return unit_map.get(simple, simple)
+
+
+def _simplify_wind_ordinance_types(types: pd.Series) -> pd.Series:
+    simplify = partial(
+        _simplify_ordinance_type,
+        water_tokens=_WIND_WATER_TOKENS,
+        type_map=_WIND_TYPE_MAP,
     )
-    return simple
+    return _map_categories(types, simplify)
 
 
-def _simplify_wind_units(units: pd.Series) -> pd.Series:
-    simple = units.str.lower().str.strip().str.replace("-", " ", regex=False)
-    simple.replace(
-        {
-            "meter": "meters",
-            "turbine count": "turbines",
-            "rotor diameter mutliplier": "rotor diameter multiplier",
-            "max tip height": "max tip height multiplier",
-            "rotor diameter": "rotor diameter multiplier",
-            "rotor radius": "rotor radius multiplier",
-        },
-        inplace=True,
+def _simplify_solar_ordinance_types(types: pd.Series) -> pd.Series:
+    simplify = partial(
+        _simplify_ordinance_type,
+        water_tokens=_SOLAR_WATER_TOKENS,
+        type_map=_SOLAR_TYPE_MAP,
     )
-    return simple
+    return _map_categories(types, simplify)
+
+
+def _simplify_wind_units(units: pd.Series) -> pd.Series:
+    simplify = partial(_simplify_unit, unit_map=_WIND_UNIT_MAP, replace_hyphens=True)
+    return _map_categories(units, simplify)
 
 
 def _simplify_solar_units(units: pd.Series) -> pd.Series:
-    simple = units.str.lower().str.strip()
-    simple.replace(
-        {
-            "meter": "meters",
-            "megawatt": "megawatts",
-            "n/a": np.nan,
-            "maximum structure height": "maximum structure height multiplier",
-        },
-        inplace=True,
-    )
-    return simple
+    simplify = partial(_simplify_unit, unit_map=_SOLAR_UNIT_MAP)
+    return _map_categories(units, simplify)
 
 
 def _manual_local_wind_corrections(local_wind: pd.DataFrame) -> None:
@@ -218,19 +266,24 @@ def _manual_local_wind_corrections(local_wind: pd.DataFrame) -> None:
     # It should be called first in the transform order.
 
     # correct multipliers that are actually setbacks in meters.
-    erroneous_multipliers = local_wind[
-        "raw_units"
-    ].str.lower().str.strip().str.endswith("multiplier") & pd.to_numeric(
-        local_wind["raw_value"], errors="coerce"
-    ).gt(
-        30
-    ).fillna(
-        False
+    numeric_values = pd.to_numeric(local_wind["raw_value"], errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan
     )
+    is_multiplier = np.array(
+        [
+            isinstance(unit, str) and unit.lower().strip().endswith("multiplier")
+            for unit in local_wind["raw_units"].to_numpy()
+        ],
+        dtype=bool,
+    )
+    erroneous_multipliers = is_multiplier & (numeric_values > 30)
     assert (
         erroneous_multipliers.sum() == 6
     ), f"Assumption violation: expected 6 erroneous multipliers, got {erroneous_multipliers.sum()}"
-    local_wind.loc[erroneous_multipliers, "raw_units"] = "Meters"
+    # text columns are Arrow-backed, so replace whole columns instead of .loc writes
+    local_wind["raw_units"] = local_wind["raw_units"].mask(
+        erroneous_multipliers, "Meters"
+    )
 
     # Completeness
     missing_state = local_wind["raw_state_name"].isna()
@@ -241,9 +294,11 @@ def _manual_local_wind_corrections(local_wind: pd.DataFrame) -> None:
         local_wind.loc[missing_state, "raw_town_name"].squeeze() == "Brownsville"
     ), err_msg
     # Raw data is partly sorted by state; adjacent entries are all Texas
-    local_wind.loc[missing_state, "raw_state_name"] = "Texas"
+    local_wind["raw_state_name"] = local_wind["raw_state_name"].mask(
+        missing_state, "Texas"
+    )
 
-    is_cochise = local_wind["raw_county_name"].eq("Cochise") & local_wind[
+    is_cochise = local_wind["raw_county_name"].eq("Cochise").fillna(False) & local_wind[
         ["raw_units", "raw_value"]
     ].isna().all(axis=1)
     expected_comment = (
@@ -251,7 +306,9 @@ def _manual_local_wind_corrections(local_wind: pd.DataFrame) -> None:
     )
     err_msg = "Assumption violation: Cochise, AZ comment has changed or value is no longer NaN."
     assert local_wind.loc[is_cochise, "raw_comment"].eq(expected_comment).all(), err_msg
-    local_wind.loc[is_cochise, "raw_units"] = "Max tip-height Multiplier"
+    local_wind["raw_units"] = local_wind["raw_units"].mask(
+        is_cochise, "Max tip-height Multiplier"
+    )
     local_wind.loc[is_cochise, "raw_value"] = "1 + 10 ft"
     return
 
@@ -267,19 +324,49 @@ def _manual_local_solar_corrections(local_solar: pd.DataFrame) -> None:
     err_msg = "Assumption violation: expected missing state to belong to Lee County."
     assert local_solar.loc[missing_state, "raw_county_name"].squeeze() == "Lee", err_msg
     # Raw data is partly sorted by state; adjacent entries are all Georgia
-    local_solar.loc[missing_state, "raw_state_name"] = "Georgia"
-
-    local_solar.loc[:, "raw_state_name"] = local_solar.loc[:, "raw_state_name"].replace(
-        "Forida", "Florida"
+    # text columns are Arrow-backed, so replace whole columns instead of .loc writes
+    local_solar["raw_state_name"] = (
+        local_solar["raw_state_name"]
+        .mask(missing_state, "Georgia")
+        .replace("Forida", "Florida")
     )
 
     return
 
 
+def _combine_localities(ordinances: pd.DataFrame) -> np.ndarray:
+    """Use "<county> County" where a county is given, otherwise the town name."""
+    county = ordinances["raw_county_name"].to_numpy(dtype=object)
+    combined = ordinances["raw_town_name"].to_numpy(dtype=object, copy=True)
+    has_county = pd.notna(county)
+    # only build the suffixed strings that are kept
+    combined[has_county] = county[has_county] + " County"
+    return combined
+
+
+def _add_county_fips_to_localities(ordinances: pd.DataFrame) -> pd.DataFrame:
+    """Geocode the locality of each ordinance and attach the results.
+
+    NREL has one row per ordinance, so most jurisdictions appear many times, but
+    add_county_fips_with_backup_geocoding only looks up each unique pair once.
+    """
+    # build the geocoding keys on the side so the ordinances never carry them
+    localities = pd.DataFrame(
+        {
+            "raw_state_name": ordinances["raw_state_name"],
+            "combined_locality": _combine_localities(ordinances),
+        },
+        index=ordinances.index,
+    )
+    geocoded = add_county_fips_with_backup_geocoding(
+        localities, state_col="raw_state_name", locality_col="combined_locality"
+    )
+    new_cols = [col for col in geocoded.columns if col not in localities.columns]
+    return pd.concat([ordinances, geocoded.loc[:, new_cols]], axis=1, copy=False)
+
+
 def local_wind_transform(raw_local_wind: pd.DataFrame) -> pd.DataFrame:
     """Transform NREL local wind ordinance dataframe."""
-    wind = raw_local_wind.copy()
-    wind.columns = _format_column_names(wind.columns)
     rename_dict = {
         "state": "raw_state_name",
         "city_or_town": "raw_town_name",
@@ -297,45 +384,44 @@ def local_wind_transform(raw_local_wind: pd.DataFrame) -> pd.DataFrame:
         "new_capture_date": "updated_year_recorded",
         "update_status": "update_status",
     }
-    wind.rename(columns=rename_dict, inplace=True)
-    for col in ["raw_state_name", "raw_town_name", "raw_county_name"]:
-        wind.loc[:, col] = wind.loc[:, col].str.strip()
+    formatted_cols = _format_column_names(raw_local_wind.columns)
+    wind = raw_local_wind.rename(
+        columns={
+            col: rename_dict.get(formatted, formatted)
+            for col, formatted in zip(raw_local_wind.columns, formatted_cols)
+        }
+    )  # copy
+    wind[_RAW_TEXT_COLS] = wind[_RAW_TEXT_COLS].astype(pd.StringDtype())
+    for col in _LOCALITY_COLS:
+        wind[col] = _strip_categories(wind[col])
 
     _manual_local_wind_corrections(wind)
     wind["ordinance_type"] = _simplify_wind_ordinance_types(wind["raw_ordinance_type"])
     wind["units"] = _simplify_wind_units(wind["raw_units"])
-    # convert dtype because the native (mixed) types don't work with .str.replace()
-    wind["value"] = (
-        wind.loc[:, "raw_value"]
-        .astype(pd.StringDtype())
-        .str.replace("or less$", "", regex=True)
-    )  # copy
-    _replace_multivalued_with_worst_case(wind.loc[:, "value"], wind.loc[:, "units"])
-    _replace_linear_definitions_with_constants(
-        wind.loc[:, "value"], wind.loc[:, "units"]
+    # convert dtype because the native (mixed) types don't work with .str methods
+    raw_values = wind["raw_value"].astype(pd.StringDtype()).to_numpy()
+    wind["value"] = pd.Series(
+        [v.removesuffix("or less") if isinstance(v, str) else v for v in raw_values],
+        index=wind.index,
+        dtype=pd.StringDtype(),
+    )
+    wind["value"] = _replace_multivalued_with_worst_case(wind["value"], wind["units"])
+    wind["value"], wind["units"] = _replace_linear_definitions_with_constants(
+        wind["value"], wind["units"]
     )
     wind["energy_type"] = "wind"
 
+    wind["value"] = pd.to_numeric(wind["value"], downcast="float")
     year_cols = ["year_enacted", "year_recorded", "updated_year_recorded"]
-    for col in ["value"] + year_cols:
-        wind.loc[:, col] = pd.to_numeric(wind.loc[:, col], downcast="float")
-    wind.loc[:, year_cols] = wind.loc[:, year_cols].astype(pd.Int16Dtype())
+    wind[year_cols] = wind[year_cols].apply(pd.to_numeric).astype(pd.Int16Dtype())
 
-    wind["combined_locality"] = (
-        wind["raw_county_name"].add(" County").fillna(wind["raw_town_name"])
-    )
-    wind = add_county_fips_with_backup_geocoding(
-        wind, state_col="raw_state_name", locality_col="combined_locality"
-    )
-    wind.drop(columns="combined_locality", inplace=True)
+    wind = _add_county_fips_to_localities(wind)
 
     return wind
 
 
 def local_solar_transform(raw_local_solar: pd.DataFrame) -> pd.DataFrame:
     """Transform NREL local solar ordinance dataframe."""
-    solar = raw_local_solar.copy()
-    solar.columns = _format_column_names(solar.columns)
     rename_dict = {
         "state": "raw_state_name",
         "city_or_town": "raw_town_name",
@@ -353,100 +439,146 @@ def local_solar_transform(raw_local_solar: pd.DataFrame) -> pd.DataFrame:
         "new_capture_date": "updated_year_recorded",
         "update_status": "update_status",
     }
-    solar.rename(columns=rename_dict, inplace=True)
-    for col in ["raw_state_name", "raw_town_name", "raw_county_name"]:
-        solar.loc[:, col] = solar.loc[:, col].str.strip()
+    formatted_cols = _format_column_names(raw_local_solar.columns)
+    solar = raw_local_solar.rename(
+        columns={
+            col: rename_dict.get(formatted, formatted)
+            for col, formatted in zip(raw_local_solar.columns, formatted_cols)
+        }
+    )  # copy
+    solar[_RAW_TEXT_COLS] = solar[_RAW_TEXT_COLS].astype(pd.StringDtype())
+    for col in _LOCALITY_COLS:
+        solar[col] = _strip_categories(solar[col])
 
     _manual_local_solar_corrections(solar)
     solar["ordinance_type"] = _simplify_solar_ordinance_types(
         solar["raw_ordinance_type"]
     )
     solar["units"] = _simplify_solar_units(solar["raw_units"])
-    solar["value"] = solar.loc[:, "raw_value"].copy()
-    _replace_multivalued_with_worst_case(solar.loc[:, "value"], solar.loc[:, "units"])
+    solar["value"] = _replace_multivalued_with_worst_case(
+        solar["raw_value"], solar["units"]
+    )
     solar["energy_type"] = "solar"
 
+    solar["value"] = pd.to_numeric(solar["value"], downcast="float")
     year_cols = ["year_enacted", "year_recorded", "updated_year_recorded"]
-    for col in ["value"] + year_cols:
-        solar.loc[:, col] = pd.to_numeric(solar.loc[:, col], downcast="float")
-    solar.loc[:, year_cols] = solar.loc[:, year_cols].astype(pd.Int16Dtype())
+    solar[year_cols] = solar[year_cols].apply(pd.to_numeric).astype(pd.Int16Dtype())
 
-    solar["combined_locality"] = (
-        solar["raw_county_name"].add(" County").fillna(solar["raw_town_name"])
-    )
-    solar = add_county_fips_with_backup_geocoding(
-        solar, state_col="raw_state_name", locality_col="combined_locality"
-    )
-    solar.drop(columns="combined_locality", inplace=True)
+    solar = _add_county_fips_to_localities(solar)
     return solar
 
 
 def _convert_sound_to_distance(
-    received_db_target, source_db=106, attenuation_dbm=0.005
-):
-    # Solve this simple sound model: https://www.wkcgroup.com/tools-room/wind-turbine-noise-calculator/
-    def received_db_func(r):
-        return source_db - 10 * np.log10(2 * np.pi * r * r) - attenuation_dbm * r
-
-    def objective_func(r):  # set equal to 0
-        return received_db_func(r) - received_db_target
-
-    # I used derivatives in a newton method but it kept finding the negative roots, which I don't want.
-    # def objective_func_derivative(r):
-    #     return -20 / (r * np.log(10))- attenuation_dbm
-    # def objective_func_2nd_derivative(r):
-    #     return 20 / np.log(10) * np.power(r, -2)
-    distance = root_scalar(
-        objective_func,
-        # fprime=objective_func_derivative,
-        # fprime2=objective_func_2nd_derivative,
-        bracket=(0.1, 1e5),  # look for positive valued root
-        x0=570,  # near 40dB solution
-        xtol=0.01,  # don't need great accuracy
-        method="brentq",
-        maxiter=100,
-    )
-    if not distance.converged:
+    received_db_targets: np.ndarray,
+    source_db=106,
+    attenuation_dbm=0.005,
+    xtol=0.01,
+    maxiter=30,
+) -> np.ndarray:
+    """Invert a simple sound model to find the distance at which each target dB is received.
+
+    The model is from https://www.wkcgroup.com/tools-room/wind-turbine-noise-calculator/
+    Only the target varies between rows, so all targets are solved at once with a
+    vectorized Newton's method.
+
+    Args:
+        received_db_targets (np.ndarray): 1D array of received sound levels in dB
+        source_db (int, optional): sound power of the source in dB. Defaults to 106.
+        attenuation_dbm (float, optional): atmospheric attenuation in dB/m. Defaults to 0.005.
+        xtol (float, optional): convergence tolerance in dB. Defaults to 0.01.
+        maxiter (int, optional): maximum number of Newton iterations. Defaults to 30.
+
+    Raises:
+        ValueError: if any target fails to converge
+
+    Returns:
+        np.ndarray: distances in meters
+    """
+    targets = np.asarray(received_db_targets, dtype=np.float64)
+    # The objective is monotone decreasing and convex in r, so Newton steps approach
+    # the root from the left. Clipping keeps iterates away from the negative root.
+    r = np.full_like(targets, 570.0)  # near 40dB solution
+    for _ in range(maxiter):
+        f = source_db - 10 * np.log10(2 * np.pi * r * r) - attenuation_dbm * r - targets
+        if np.abs(f).max(initial=0.0) < xtol:
+            break
+        fprime = -20.0 / (r * np.log(10.0)) - attenuation_dbm
+        r = np.clip(r - f / fprime, 0.1, 1e5)
+    else:
         raise ValueError(
-            f"sound model failed to converge with target {received_db_target} dB and source power {source_db} dB"
+            f"sound model failed to converge with targets {targets[~(np.abs(f) < xtol)]} dB and source power {source_db} dB"
         )
-    return distance.root
+    return r
+
+
+# Constants used to convert multipliers to constant distances.
+# Based on reference turbine of 127m rotor diameter, 89m hub height, 3 MW
+_ROTOR_DIAMETER_METERS = 127.0
+_HUB_HEIGHT_METERS = 89.0
+_SOLAR_HEIGHT_METERS = 15 * FEET_TO_METERS
+_REFERENCE_DISTANCES = {
+    "maximum structure height multiplier": _SOLAR_HEIGHT_METERS,
+    "hub height multiplier": _HUB_HEIGHT_METERS,
+    "max tip height multiplier": _HUB_HEIGHT_METERS + _ROTOR_DIAMETER_METERS / 2 - 1,
+    "rotor diameter multiplier": _ROTOR_DIAMETER_METERS,
+    "rotor radius multiplier": _ROTOR_DIAMETER_METERS / 2,
+}
+_STANDARDIZED_UNITS = {key: "meters" for key in _REFERENCE_DISTANCES.keys()}
+_STANDARDIZED_UNITS["dba"] = "meters"
+
+# solar reference: https://rsginc.com/wp-content/uploads/2021/04/Kaliski-et-al-2020-An-overview-of-sound-from-commercial-photovolteic-facilities.pdf
+# 2 MW inverter w/ cooling fan ~100dB
+_REFERENCE_SOUND_POWER_DB = {"solar": 100, "wind": 106}
+# The sound model only depends on the target dB, so solve it once on a grid at
+# import time and interpolate instead of re-solving for every row.
+_SOUND_DB_GRID = np.arange(20.0, 80.0, 0.1)
+_SOUND_DISTANCE_CURVES = {
+    energy_type: _convert_sound_to_distance(_SOUND_DB_GRID, source_db=source_db)
+    for energy_type, source_db in _REFERENCE_SOUND_POWER_DB.items()
+}
+
+
+def _sound_to_distance(received_db_targets: np.ndarray, energy_type: str) -> np.ndarray:
+    """Look up distances on the precomputed sound curve, solving directly off the grid."""
+    distances = np.interp(
+        received_db_targets, _SOUND_DB_GRID, _SOUND_DISTANCE_CURVES[energy_type]
+    )
+    off_grid = ~(
+        (received_db_targets >= _SOUND_DB_GRID[0])
+        & (received_db_targets <= _SOUND_DB_GRID[-1])
+    )
+    if off_grid.any():
+        # sound limits repeat a handful of values, so solve each one once
+        unique_targets, inverse = np.unique(
+            received_db_targets[off_grid], return_inverse=True
+        )
+        solved = _convert_sound_to_distance(
+            unique_targets, source_db=_REFERENCE_SOUND_POWER_DB[energy_type]
+        )
+        distances[off_grid] = solved[inverse]
+    return distances
 
 
-def _standardize_units_to_distances(
-    nrel_df: pd.DataFrame,
-    rotor_diameter_meters=127.0,
-    hub_height_meters=89.0,
-    solar_height_meters=15 * FEET_TO_METERS,
-) -> pd.DataFrame:
+def _standardize_units_to_distances(nrel_df: pd.DataFrame) -> pd.DataFrame:
     # NOTE: solar sound limits really apply to inverters, not to panels.
     # They are not directly comparable and should be treated separately.
-
-    # Constants used to convert multipliers to constant distances.
-    # Based on reference turbine of 127m rotor diameter, 89m hub height, 3 MW
-    reference_map = {
-        "maximum structure height multiplier": solar_height_meters,
-        "hub height multiplier": hub_height_meters,
-        "max tip height multiplier": hub_height_meters + rotor_diameter_meters / 2 - 1,
-        "rotor diameter multiplier": rotor_diameter_meters,
-        "rotor radius multiplier": rotor_diameter_meters / 2,
-    }
-    unit_map = {key: "meters" for key in reference_map.keys()}
-    unit_map["dba"] = "meters"
-
-    constants = nrel_df["units"].map(reference_map).fillna(1.0)
+    constants = nrel_df["units"].map(_REFERENCE_DISTANCES).fillna(1.0)
     standardized_values = nrel_df["value"].mul(constants).rename("standardized_value")
-    standardized_units = nrel_df["units"].replace(unit_map).rename("standardized_units")
+    standardized_units = (
+        nrel_df["units"].replace(_STANDARDIZED_UNITS).rename("standardized_units")
+    )
 
-    # solar reference: https://rsginc.com/wp-content/uploads/2021/04/Kaliski-et-al-2020-An-overview-of-sound-from-commercial-photovolteic-facilities.pdf
-    # 2 MW inverter w/ cooling fan ~100dB
-    reference_sound_power_db = {"solar": 100, "wind": 106}
-    for energy_type, source_db in reference_sound_power_db.items():
-        sound_estimate = partial(_convert_sound_to_distance, source_db=source_db)
+    for energy_type in _REFERENCE_SOUND_POWER_DB.keys():
         noise_filter = nrel_df["energy_type"].eq(energy_type) & nrel_df["units"].eq(
             "dba"
         )
-        noise = nrel_df.loc[noise_filter, "value"].apply(sound_estimate)
+        noise = pd.Series(
+            _sound_to_distance(
+                nrel_df.loc[noise_filter, "value"].to_numpy(dtype=np.float64),
+                energy_type=energy_type,
+            ),
+            index=nrel_df.index[noise_filter],
+        )
         assert noise.gt(
             0
         ).all(), (
@@ -506,35 +638,48 @@ def _define_bans(nrel_standardized: pd.DataFrame) -> pd.DataFrame:
     de_jure_ban = nrel_standardized["ordinance_type"].eq("banned")
 
     # fix a known false positive: the only height limit defined on hub height instead of total height
-    idx = nrel_standardized["raw_comment"].eq("Max hub height 80 meters (263')")
+    idx = (
+        nrel_standardized["raw_comment"]
+        .eq("Max hub height 80 meters (263')")
+        .fillna(False)
+    )
     assert (
         idx.sum() == 1
     ), f"False positive check is poorly defined. Should be one, got {idx.sum()}."
     wind_height_ban.loc[idx] = False
 
-    is_ban = reduce(
-        or_,
-        (
-            wind_setback_ban,
-            solar_setback_ban,
-            sound_ban,
-            wind_height_ban,
-            solar_height_ban,
-            saturation_ban,
-            de_jure_ban,
-        ),
-    ).rename("is_ban")
+    ban_types = np.vstack(
+        [
+            ban.to_numpy(dtype=bool)
+            for ban in (
+                wind_setback_ban,
+                solar_setback_ban,
+                sound_ban,
+                wind_height_ban,
+                solar_height_ban,
+                saturation_ban,
+                de_jure_ban,
+            )
+        ]
+    )
+    is_ban = pd.Series(
+        np.logical_or.reduce(ban_types, axis=0),
+        index=nrel_standardized.index,
+        name="is_ban",
+    )
     is_de_facto_ban = (is_ban & ~de_jure_ban).rename("is_de_facto_ban")
     return pd.concat([is_ban, is_de_facto_ban], axis=1, copy=False)
 
 
 def _add_derived_columns(merged_nrel_dfs: pd.DataFrame) -> pd.DataFrame:
+    # assign columns in place rather than re-concatenating the whole frame
     standardized = _standardize_units_to_distances(merged_nrel_dfs)
-    nrel = pd.concat(
-        [merged_nrel_dfs, standardized], axis=1, copy=False
-    )  # _define_bans() needs both
-    nrel = pd.concat([nrel, _define_bans(nrel)], axis=1, copy=False)
-    return nrel
+    for col in standardized.columns:
+        merged_nrel_dfs[col] = standardized[col]
+    bans = _define_bans(merged_nrel_dfs)  # needs both original and standardized
+    for col in bans.columns:
+        merged_nrel_dfs[col] = bans[col]
+    return merged_nrel_dfs
 
 
 def transform(nrel_raw_dfs: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
@@ -1,5 +1,6 @@
 """Transform and normalize offshore wind location and project data from Airtable."""
 
+import numpy as np
 import pandas as pd
 
 from dbcp.transform.helpers import add_county_fips_with_backup_geocoding
@@ -8,11 +9,11 @@ from pudl.helpers import simplify_columns
 
 def _transform_columns(
     raw_df: pd.DataFrame, *, cols_to_drop: list[str], rename_dict: dict[str, str]
-) -> None:
-    simplify_columns(raw_df)
-    raw_df.drop(columns=cols_to_drop, inplace=True)
-    raw_df.rename(columns=rename_dict, inplace=True)
-    return
+) -> pd.DataFrame:
+    out = raw_df.copy(deep=False)  # simplify_columns renames in place
+    simplify_columns(out)
+    # drop already returns a new frame, so rename doesn't need to copy it again
+    return out.drop(columns=cols_to_drop).rename(columns=rename_dict, copy=False)
 
 
 def _association_table_from_csv_array(ser: pd.Series, name="id") -> pd.Series:
@@ -28,26 +29,46 @@ def _association_table_from_csv_array(ser: pd.Series, name="id") -> pd.Series:
     'b'  '3'
     'b'  '7'
     """
-    expanded = ser.str.split(",", expand=True)
-    out = (
-        expanded.melt(value_vars=expanded.columns, value_name=name, ignore_index=False)
-        .dropna()
-        .loc[:, name]
-        .str.strip()
-    )
+    # explode the lists directly instead of padding them into a wide frame to melt
+    out = ser.dropna().str.split(",").explode().str.strip().rename(name)
     return out
 
 
-def _id_association_table_from_csv_array(
-    ser: pd.Series, name="project_id"
-) -> pd.DataFrame:
-    """Special case of _association_table_from_csv_array for the integer ID arrays in this particular dataset."""
-    out = (
-        _association_table_from_csv_array(ser, name=name)
-        .astype(int)
-        .reset_index()
-        .sort_values(["location_id", "project_id"])
+def _id_pairs_from_csv_array(ser: pd.Series, reverse=False) -> set[tuple[int, int]]:
+    """Set of (index, ID) pairs from a series of integer ID CSV arrays, or (ID, index) if reverse."""
+    ids = _association_table_from_csv_array(ser).astype(int)
+    pairs = zip(ids, ids.index) if reverse else zip(ids.index, ids)
+    return set(pairs)
+
+
+def _id_association_tables_from_csv_arrays(
+    df: pd.DataFrame, table_cols: dict[str, str], name="project_id"
+) -> dict[str, pd.DataFrame]:
+    """Build several ID association tables with a single split and explode.
+
+    Args:
+        df (pd.DataFrame): dataframe with one CSV array column per table
+        table_cols (dict[str, str]): map of output table name to CSV array column
+        name (str, optional): name of the exploded ID column. Defaults to "project_id".
+
+    Returns:
+        dict[str, pd.DataFrame]: association tables keyed by table name
+    """
+    melted = (
+        df.loc[:, list(table_cols.values())]
+        .melt(var_name="array_col", value_name=name, ignore_index=False)
+        .dropna(subset=[name])
     )
+    melted[name] = melted[name].str.split(",")
+    exploded = melted.explode(name)
+    exploded[name] = exploded[name].str.strip().astype(int)
+    pk = [df.index.name, name]
+    out = {
+        table_name: exploded.loc[exploded["array_col"].eq(col), [name]]
+        .reset_index()
+        .sort_values(pk)
+        for table_name, col in table_cols.items()
+    }
     return out
 
 
@@ -66,39 +87,31 @@ def _add_geocoded_locations(transformed_locs: pd.DataFrame) -> None:
     Args:
         transformed_locs (pd.DataFrame): locations df after other cleaning has been performed
     """
-    # this code is ugly and procedural for the sake of making inplace operations.
-    # And all to save copy operations on a dataframe that is... 50 rows lol. Dumb!
     transformed_locs["city_county"] = (
         transformed_locs["raw_city"] + ", " + transformed_locs["raw_county"]
     )
-    first_pass = add_county_fips_with_backup_geocoding(
-        transformed_locs[["city_county", "raw_state_abbrev"]],
+    geocoded = add_county_fips_with_backup_geocoding(
+        transformed_locs[["city_county", "raw_city", "raw_state_abbrev"]],
         state_col="raw_state_abbrev",
         locality_col="city_county",
+        fallback_locality_col="raw_city",
     )
     transformed_locs.drop(columns=["city_county"], inplace=True)
 
-    nan_fips_idx = first_pass["county_id_fips"].isna()
-    second_pass = add_county_fips_with_backup_geocoding(
-        transformed_locs.loc[nan_fips_idx, ["raw_city", "raw_state_abbrev"]],
-        state_col="raw_state_abbrev",
-        locality_col="raw_city",
-    )
-
     cols_to_fill = [
         "county_id_fips",
         "geocoded_locality_name",
         "geocoded_locality_type",
         "geocoded_containing_county",
     ]
-    first_pass.update(second_pass.loc[:, cols_to_fill])
-    transformed_locs.loc[:, cols_to_fill] = first_pass[cols_to_fill]
+    transformed_locs[cols_to_fill] = geocoded[cols_to_fill]
     return
 
 
 def _validate_raw_data(raw_dfs: dict[str, pd.DataFrame]) -> None:
-    proj = raw_dfs["offshore_projects"].copy()
-    locs = raw_dfs["offshore_locations"].copy()
+    # read-only checks, so no copies needed
+    proj = raw_dfs["offshore_projects"]
+    locs = raw_dfs["offshore_locations"]
     for df in (proj, locs):
         assert (
             not df.eq("").any().any()
@@ -122,27 +135,17 @@ def _validate_raw_data(raw_dfs: dict[str, pd.DataFrame]) -> None:
     ), "Found project with erroneously late online_date."
 
     # check referential symmetry (should be handled by Airtable, but check anyway)
-    locations_to_landings = pd.MultiIndex.from_frame(
-        _id_association_table_from_csv_array(locs["Cable project IDs"])
-    )
-    landing_to_locations = pd.MultiIndex.from_frame(
-        _id_association_table_from_csv_array(
-            proj["Cable Location IDs"], name="location_id"
-        )[
-            ["location_id", "project_id"]
-        ]  # reorder columns
+    locations_to_landings = _id_pairs_from_csv_array(locs["Cable project IDs"])
+    landing_to_locations = _id_pairs_from_csv_array(
+        proj["Cable Location IDs"], reverse=True
     )
-    assert locations_to_landings.symmetric_difference(landing_to_locations).empty
+    assert locations_to_landings == landing_to_locations
 
-    locations_to_ports = pd.MultiIndex.from_frame(
-        _id_association_table_from_csv_array(locs["assembly/manufac project IDs"])
+    locations_to_ports = _id_pairs_from_csv_array(locs["assembly/manufac project IDs"])
+    ports_to_locations = _id_pairs_from_csv_array(
+        proj["Port Location IDs"], reverse=True
     )
-    ports_to_locations = pd.MultiIndex.from_frame(
-        _id_association_table_from_csv_array(
-            proj["Port Location IDs"], name="location_id"
-        )[["location_id", "project_id"]]
-    )
-    assert locations_to_ports.symmetric_difference(ports_to_locations).empty
+    assert locations_to_ports == ports_to_locations
     return
 
 
@@ -154,11 +157,13 @@ def _add_actionable_and_nearly_certain_classification(projects: pd.DataFrame) ->
     nearly_certain_statuses = {
         "Construction underway",
     }
-    projects.loc[:, "is_actionable"] = projects["construction_status"].isin(
-        actionable_statuses
+    # compare plain object arrays; None instead of pd.NA keeps np.isin elementwise
+    statuses = projects["construction_status"].to_numpy(dtype=object, na_value=None)
+    projects["is_actionable"] = np.isin(
+        statuses, np.array(list(actionable_statuses), dtype=object)
     )
-    projects.loc[:, "is_nearly_certain"] = projects["construction_status"].isin(
-        nearly_certain_statuses
+    projects["is_nearly_certain"] = np.isin(
+        statuses, np.array(list(nearly_certain_statuses), dtype=object)
     )
     return None
 
@@ -166,8 +171,6 @@ def _add_actionable_and_nearly_certain_classification(projects: pd.DataFrame) ->
 def transform(raw_dfs: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
     """Transform offshore wind data."""
     _validate_raw_data(raw_dfs=raw_dfs)
-    proj = raw_dfs["offshore_projects"].copy()
-    locs = raw_dfs["offshore_locations"].copy()
     # NOTE: the following column names are not raw names!
     # They are the results of simplify_columns(), which is called in _transform_columns
     proj_cols_to_drop = [
@@ -190,23 +193,27 @@ def transform(raw_dfs: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
         "county": "raw_county",
         "county_fips": "raw_county_fips",
     }
-    _transform_columns(
-        proj, cols_to_drop=proj_cols_to_drop, rename_dict=proj_rename_dict
+    proj = _transform_columns(
+        raw_dfs["offshore_projects"],
+        cols_to_drop=proj_cols_to_drop,
+        rename_dict=proj_rename_dict,
     )
-    _transform_columns(
-        locs, cols_to_drop=locs_cols_to_drop, rename_dict=locs_rename_dict
+    locs = _transform_columns(
+        raw_dfs["offshore_locations"],
+        cols_to_drop=locs_cols_to_drop,
+        rename_dict=locs_rename_dict,
     )
 
-    proj.loc[:, "recipient_state"].replace({"TBD": pd.NA}, inplace=True)
+    proj["recipient_state"] = proj["recipient_state"].replace({"TBD": pd.NA})
     _add_actionable_and_nearly_certain_classification(projects=proj)
 
-    transformed_dfs = {}
-    transformed_dfs[
-        "offshore_wind_cable_landing_association"
-    ] = _id_association_table_from_csv_array(locs["cable_project_ids"])
-    transformed_dfs[
-        "offshore_wind_port_association"
-    ] = _id_association_table_from_csv_array(locs["assembly_manufac_project_ids"])
+    transformed_dfs = _id_association_tables_from_csv_arrays(
+        locs,
+        {
+            "offshore_wind_cable_landing_association": "cable_project_ids",
+            "offshore_wind_port_association": "assembly_manufac_project_ids",
+        },
+    )
     # CSV array fields no longer needed (proj CSV fields could be dropped after _validate_raw_data())
     locs.drop(
         columns=["cable_project_ids", "assembly_manufac_project_ids"], inplace=True
@@ -1,7 +1,8 @@
 """Data Validation tests."""
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
-from io import StringIO
+from typing import Callable, Sequence
 
 import pandas as pd
 from sqlalchemy.engine import Engine
@@ -41,98 +42,86 @@ def test_j40_county_fips_coverage(engine: Engine):
     USING (county_id_fips)
     where j.county_id_fips is null
     or c.county_id_fips is null
-    order by j40_fips desc nulls last, c_fips desc nulls last
     """
-    expected = pd.read_csv(
-        StringIO(
-            """j40_fips,c_fips
-51515,null
-46113,null
-02270,null
-02261,null
-null,46102
-null,02158
-null,02066
-null,02063
-"""
-        ),
-        dtype="string",
-        header=0,
-    )
-    actual = pd.read_sql(query, engine).astype("string")
-    pd.testing.assert_frame_equal(actual, expected)
+    # compare sets of rows so the test doesn't depend on (or pay for) a sort
+    expected = {
+        ("51515", None),
+        ("46113", None),
+        ("02270", None),
+        ("02261", None),
+        (None, "46102"),
+        (None, "02158"),
+        (None, "02066"),
+        (None, "02063"),
+    }
+    actual = set(pd.read_sql(query, engine).itertuples(index=False, name=None))
+    assert (
+        actual == expected
+    ), f"Unexpected Justice40 vs Census FIPS differences: {actual.symmetric_difference(expected)}"
 
 
 def test_gridstatus_fips_coverage(engine: Engine):
     """Make sure we have high coverage for county_id_fips codes or gridstatus_projects."""
-    with engine.connect() as con:
-        gridstatus_locations = pd.read_sql_table(
-            "gridstatus_locations", con, schema="data_warehouse"
-        )
+    # only the null fraction is needed, so compute it rather than fetch the table
+    query = """
+    SELECT
+        count(*) FILTER (WHERE county_id_fips IS NULL)::float / count(*) as frac_missing
+    FROM data_warehouse.gridstatus_locations
+    """
+    frac_missing = pd.read_sql(query, engine).squeeze()
     assert (
-        gridstatus_locations.county_id_fips.isna().sum() / len(gridstatus_locations)
-        < 0.02
+        frac_missing < 0.02
     ), "More than 2 percent of Grid Status locations could not be geocoded."
 
 
 def test_iso_projects_sources(engine: Engine):
     """Check that the right resources come from the right sources."""
-    # all offshore wind projects from the proprietary source
-    proprietary_offshore = """
-    SELECT
+    # fetch the sources of offshore wind and ISO projects in one round trip
+    query = """
+    SELECT DISTINCT
         source,
-        count(*) as n_offshore
+        coalesce(resource_clean ~* 'offshore', false) as is_offshore,
+        coalesce(iso_region ~* 'caiso|ercot|miso|nyiso|pjm|spp|isone', false) as is_iso
     from data_mart.iso_projects_long_format
     where resource_clean ~* 'offshore'
-    group by 1
+        or iso_region ~* 'caiso|ercot|miso|nyiso|pjm|spp|isone'
     """
+    sources = pd.read_sql(query, engine)
+
+    # all offshore wind projects from the proprietary source
     expected_source = {"proprietary"}
-    offshore_test = pd.read_sql(
-        proprietary_offshore, engine, index_col="source"
-    ).squeeze(
-        axis=1
-    )  # make series
-    actual_source = set(offshore_test.index)
+    actual_source = set(sources.loc[sources["is_offshore"], "source"])
     assert (
         actual_source == expected_source
-    ), f"Found offshore wind projects from the wrong source. {offshore_test}"
+    ), f"Found offshore wind projects from the wrong source. {actual_source}"
 
     # all ISO projects from the gridstatus source
-    iso_projects = """
-    SELECT
-        source,
-        count(*) as n_iso
-    from data_mart.iso_projects_long_format
-    where iso_region ~* 'caiso|ercot|miso|nyiso|pjm|spp|isone'
-    group by 1
-    """
     expected_source = {"gridstatus"}  # region is currently NULL for offshore wind
-    iso_test = pd.read_sql(iso_projects, engine, index_col="source").squeeze(axis=1)
-    actual_source = set(iso_test.index)
+    actual_source = set(sources.loc[sources["is_iso"], "source"])
     assert (
         actual_source == expected_source
-    ), f"Found ISO projects from the wrong source. {iso_test}"
+    ), f"Found ISO projects from the wrong source. {actual_source}"
     # remaining projects from LBNL (non-ISO, non-offshore)
     return
 
 
 def test_iso_projects_capacity_aggs(engine: Engine):
     """Check that the capacity aggregates equal the source tables."""
-    data_mart_capacity = """
-    select
-        source,
-        resource_clean,
-        count(*) as n_project_locations,
-        -- double count capacity when there are multiple locations. Simplifies the test
-        sum(capacity_mw) as capacity_double_count_county
-    from data_mart.iso_projects_long_format
-    group by 1, 2
-    order by 1, 2
-    """
-    # simplified reimplementation of the data_mart.iso_projects_long_format table.
-    # This skips over the multi-county allocation stuff for simplicity.
-    source_capacity = """
+    # Join the data mart aggregates to a simplified reimplementation of the
+    # data_mart.iso_projects_long_format table in one round trip.
+    # The reimplementation skips over the multi-county allocation stuff for simplicity.
+    query = """
     with
+    data_mart as (
+        select
+            source,
+            resource_clean,
+            count(*) as n_project_locations,
+            -- double count capacity when there are multiple locations. Simplifies the test
+            sum(capacity_mw) as capacity_double_count_county
+        from data_mart.iso_projects_long_format
+        group by 1, 2
+    ),
     lbnl as (
         select
             'lbnl' as source,
@@ -173,19 +162,33 @@ def test_iso_projects_capacity_aggs(engine: Engine):
         ON proj.project_id = loc.project_id
         WHERE proj.construction_status != 'Online'
         group by 1, 2
+    ),
+    source_tables as (
+        select * from lbnl
+        UNION ALL
+        select * from gridstatus
+        UNION ALL
+        select * from offshore
     )
-    select * from lbnl
-    UNION ALL
-    select * from gridstatus
-    UNION ALL
-    select * from offshore
+    select
+        source,
+        resource_clean,
+        dm.n_project_locations as dm_n_project_locations,
+        dm.capacity_double_count_county as dm_capacity_double_count_county,
+        src.n_project_locations as src_n_project_locations,
+        src.capacity_double_count_county as src_capacity_double_count_county
+    from data_mart as dm
+    full outer join source_tables as src
+    USING (source, resource_clean)
     order by 1, 2
     """
-    data_mart = pd.read_sql(
-        data_mart_capacity, engine, index_col=["source", "resource_clean"]
+    capacity = pd.read_sql(query, engine, index_col=["source", "resource_clean"])
+    metrics = ["n_project_locations", "capacity_double_count_county"]
+    data_mart = capacity.loc[:, [f"dm_{col}" for col in metrics]].set_axis(
+        metrics, axis=1
     )
-    source = pd.read_sql(
-        source_capacity, engine, index_col=["source", "resource_clean"]
+    source = capacity.loc[:, [f"src_{col}" for col in metrics]].set_axis(
+        metrics, axis=1
     )
     absolute_diff = data_mart - source
     relative_diff = absolute_diff / source
@@ -208,9 +211,20 @@ def test_iso_projects_data_mart(engine: Engine):
 
 def test_county_commission_election_info(engine: Engine):
     """Check total_n_seats is >= total_n_races."""
+    cols_to_fetch = [
+        "next_primary_total_n_seats",
+        "next_primary_total_n_races",
+        "next_general_total_n_seats",
+        "next_general_total_n_races",
+        "next_run_off_total_n_seats",
+        "next_run_off_total_n_races",
+    ]
     with engine.connect() as con:
         df = pd.read_sql_table(
-            "county_commission_election_info", con, schema="data_mart"
+            "county_commission_election_info",
+            con,
+            schema="data_mart",
+            columns=cols_to_fetch,
         ).convert_dtypes()
     assert (
         df.next_primary_total_n_seats >= df.next_primary_total_n_races
@@ -225,32 +239,32 @@ def test_county_commission_election_info(engine: Engine):
 
 def test_county_wide_coverage(engine: Engine):
     """Check how many counties have technical data in counties_wide_format."""
-    cols_to_fetch = _get_non_county_cols_from_wide_format(engine)
-    query = f"SELECT {','.join(cols_to_fetch)} FROM data_mart.counties_wide_format"
-    df = pd.read_sql(query, engine)
-    n_counties = pd.read_sql(
-        "SELECT count(*) FROM data_warehouse.county_fips", engine
-    ).squeeze()
+    cols_to_check = _get_non_county_cols_from_wide_format(engine)
+    # count in postgres rather than fetching the whole table to check nulls
+    has_technical_data = " OR ".join(f"{col} IS NOT NULL" for col in cols_to_check)
+    query = f"""
+    SELECT
+        count(*) as n_rows,
+        count(*) FILTER (WHERE {has_technical_data}) as n_covered,
+        (SELECT count(*) FROM data_warehouse.county_fips) as n_counties
+    FROM data_mart.counties_wide_format
+    """
+    counts = pd.read_sql(query, engine).squeeze(axis=0)
     assert (
-        df.shape[0] == n_counties
+        counts["n_rows"] == counts["n_counties"]
     ), "counties_wide_format does not contain all counties"
-    notnull = df.notnull()
     assert (
-        notnull.any(axis=1).sum() == 2374
-    ), f"counties_wide_format has unexpected county coverage: {notnull[notnull.any(axis=1)]}"
+        counts["n_covered"] == 2374
+    ), f"counties_wide_format has unexpected county coverage: {counts['n_covered']} counties have technical data"
 
 
 def test_county_long_vs_wide(engine: Engine):
     """Check that the long and wide formats have the same data, where appropriate."""
-    offshore_wind_extra_cols = _get_offshore_wind_extra_cols(engine).columns
+    offshore_wind_extra_cols = _get_offshore_wind_extra_col_names(engine)
     # don't count the extra offshore cols because they are not present in long format (3 extra counties covered)
-    cols_to_fetch = list(
-        _get_non_county_cols_from_wide_format(engine).difference(
-            offshore_wind_extra_cols
-        )
-    ) + ["county_id_fips"]
-    query = f"SELECT {','.join(cols_to_fetch)} FROM data_mart.counties_wide_format"
-    wide_format_technical = pd.read_sql(query, engine).set_index("county_id_fips")
+    technical_cols = _get_non_county_cols_from_wide_format(engine).difference(
+        offshore_wind_extra_cols
+    )
 
     # filter long_format for only the same resources as wide_format
     resources_to_keep = {  # wide_format excludes some categories by client request
@@ -274,53 +288,58 @@ def test_county_long_vs_wide(engine: Engine):
         "Synthetic Fertilizers",
         "Petrochemicals and Plastics",
     }
+
+    is_count = technical_cols.str.endswith("_count")
+    # want to remove category aggregates to avoid double counting with the individual categories
+    is_combined_aggregate = technical_cols.str.match("fossil_|renewable_|infra_total_")
+    count_cols = technical_cols[is_count & ~is_combined_aggregate]
+
+    # aggregate in postgres rather than fetching both tables
+    has_technical_data = " OR ".join(f"{col} IS NOT NULL" for col in technical_cols)
+    total_count = " + ".join(f"COALESCE({col}, 0)" for col in count_cols)
+    wide_query = f"""
+    SELECT
+        count(DISTINCT county_id_fips) FILTER (WHERE {has_technical_data}) as n_counties,
+        sum({total_count}) as project_count
+    FROM data_mart.counties_wide_format
+    """
+    wide_format = pd.read_sql(wide_query, engine).squeeze(axis=0)
     string_wrapped = (f"'{item}'" for item in resources_to_keep)
-    shorter_long_query = f"SELECT * FROM data_mart.counties_long_format WHERE resource_or_sector in ({','.join(string_wrapped)})"
-    shorter_long_format = pd.read_sql(shorter_long_query, engine)
+    long_query = f"""
+    SELECT
+        count(DISTINCT county_id_fips) as n_counties,
+        sum(facility_count) as project_count
+    FROM data_mart.counties_long_format
+    WHERE resource_or_sector in ({','.join(string_wrapped)})
+    """
+    long_format = pd.read_sql(long_query, engine).squeeze(axis=0)
 
     # county coverage ~~of technical data~~ should be the same (not true for
     # county-level data because wide_format includes counties that don't have
     # any projects)
-    n_counties_wide = wide_format_technical.index[
-        wide_format_technical.notnull().any(axis=1)
-    ].nunique()
-    n_counties_long = shorter_long_format["county_id_fips"].nunique()
     assert (
-        n_counties_wide == n_counties_long
+        wide_format["n_counties"] == long_format["n_counties"]
     ), "counties_wide_format and counties_long_format have different county coverage"
 
     # check project counts
-    def _condition(col: str) -> bool:
-        is_count = col.endswith("_count")
-        # want to remove category aggregates to avoid double counting with the individual categories
-        is_combined_aggregate = (
-            col.startswith("fossil_")
-            or col.startswith("renewable_")
-            or col.startswith("infra_total_")
-        )
-        return is_count and not is_combined_aggregate
-
-    count_cols = [col for col in wide_format_technical.columns if _condition(col)]
-    wide_project_counts = wide_format_technical.loc[:, count_cols].sum().sum()
-    long_project_counts = shorter_long_format["facility_count"].sum()
     assert (
-        long_project_counts == wide_project_counts
+        long_format["project_count"] == wide_format["project_count"]
     ), "counties_long_format has fewer projects than counties_wide_format"
 
 
 def test_manual_ordinance_fips_coverage(engine: Engine):
     """Check that manual_ordinances and county_fips have identical FIPS."""
     query = """
-    SELECT
-        m.county_id_fips as manual_fips,
-        c.county_id_fips as county_fips
+    SELECT count(*)
     FROM data_mart.manual_ordinances as m
     FULL OUTER JOIN data_warehouse.county_fips as c
     USING (county_id_fips)
     WHERE m.county_id_fips is null OR c.county_id_fips is null
     """
-    actual = pd.read_sql(query, engine)
-    assert actual.empty, "Found mismatched FIPS in manual_ordinances"
+    n_mismatched = pd.read_sql(query, engine).squeeze()
+    assert (
+        n_mismatched == 0
+    ), f"Found {n_mismatched} mismatched FIPS in manual_ordinances"
 
 
 @lru_cache(maxsize=1)
@@ -332,20 +351,49 @@ def _get_non_county_cols_from_wide_format(engine: Engine) -> pd.Index:
     return cols_to_fetch
 
 
+@lru_cache(maxsize=1)
+def _get_offshore_wind_extra_col_names(engine: Engine) -> pd.Index:
+    """Get the names of the offshore wind columns that counties_long_format doesn't have."""
+    return _get_offshore_wind_extra_cols(engine).columns
+
+
+def _run_tests_concurrently(
+    engine: Engine, tests: Sequence[Callable[[Engine], None]]
+) -> None:
+    """Run independent, read-only tests in threads and re-raise the first failure.
+
+    The tests are bound by database round trips, and the engine's connection pool
+    is thread safe, so each test checks out its own connection.
+    """
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test, engine) for test in tests]
+        for future in as_completed(futures):
+            future.result()
+
+
 def validate_warehouse(engine: Engine):
     """Run data warehouse validation tests."""
     logger.info("Validating data warehouse")
-    test_j40_county_fips_coverage(engine)
-    test_gridstatus_fips_coverage(engine)
+    _run_tests_concurrently(
+        engine, [test_j40_county_fips_coverage, test_gridstatus_fips_coverage]
+    )
 
 
 def validate_data_mart(engine: Engine):
     """Run data mart validation tests."""
     logger.info("Validating data mart")
-    test_county_long_vs_wide(engine)
-    test_county_wide_coverage(engine)
-    test_iso_projects_data_mart(engine)
-    test_county_commission_election_info(engine)
+    # both county format tests need this expensive query. Warm the cache first so
+    # the concurrent tests don't both miss it and run the query twice.
+    _get_non_county_cols_from_wide_format(engine)
+    _run_tests_concurrently(
+        engine,
+        [
+            test_county_long_vs_wide,
+            test_county_wide_coverage,
+            test_iso_projects_data_mart,
+            test_county_commission_election_info,
+        ],
+    )
 
 
 def validate_all(engine: Engine):
@@ -224,10 +224,10 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
 
 
 @pytest.mark.parametrize(
-    "geocoder,expected",
+    "geocoder_factory,expected",
     [
         (
-            mock_geocoder_street_address(),
+            mock_geocoder_street_address,
             {
                 "locality_name": "Seneca",
                 "containing_county": "Ontario County",
@@ -235,7 +235,7 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
             },
         ),
         (
-            mock_geocoder_town_and_county(),
+            mock_geocoder_town_and_county,
             {
                 "locality_name": "Westport",
                 "containing_county": "Dane County",
@@ -243,7 +243,7 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
             },
         ),
         (
-            mock_geocoder_county(),
+            mock_geocoder_county,
             {
                 "locality_name": "New Madrid",
                 "containing_county": "New Madrid County",
@@ -251,7 +251,7 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
             },
         ),
         (
-            mock_geocoder_county_explicit(),
+            mock_geocoder_county_explicit,
             {
                 "locality_name": "New Madrid County",
                 "containing_county": "New Madrid County",
@@ -259,7 +259,7 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
             },
         ),
         (
-            mock_geocoder_independent_city(),
+            mock_geocoder_independent_city,
             {
                 "locality_name": "Hampton",
                 "containing_county": "Hampton",
@@ -268,8 +268,10 @@ def mock_geocoder_independent_city() -> GoogleGeocoder:
         ),
     ],
 )
-def test_geocode_locality(geocoder, expected):
+def test_geocode_locality(geocoder_factory, expected):
     """Test the geocoder parsers."""
+    # build the mock at test time rather than at collection time
+    geocoder = geocoder_factory()
     # The following commented code is for debugging. Remove the @property decorator
     # on locality_name() to use it.
 
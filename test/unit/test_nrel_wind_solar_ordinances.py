@@ -0,0 +1,31 @@
+"""Test NREL wind and solar ordinance transforms."""
+import pandas as pd
+import pytest
+
+from dbcp.transform.nrel_wind_solar_ordinances import (
+    _replace_multivalued_with_worst_case,
+)
+
+
+@pytest.mark.parametrize(
+    "values,value_types,expected",
+    [
+        pytest.param(
+            ["100/200", "50", "30-40", None],
+            ["meters", "meters", "dba", "meters"],
+            [200.0, "50", 30.0, None],
+            id="multivalued",
+        ),
+        pytest.param(
+            ["100", "50"], ["meters", "dba"], ["100", "50"], id="no_multivalued"
+        ),
+        pytest.param([], [], [], id="empty"),
+    ],
+)
+def test__replace_multivalued_with_worst_case(values, value_types, expected):
+    """Test that multivalued entries are reduced to their worst case value."""
+    values = pd.Series(values, dtype=object)
+    value_types = pd.Series(value_types, dtype=object)
+    expected = pd.Series(expected, dtype=object)
+    actual = _replace_multivalued_with_worst_case(values, value_types)
+    pd.testing.assert_series_equal(actual, expected)
@@ -0,0 +1,104 @@
+"""Test common transform operations."""
+import numpy as np
+import pandas as pd
+
+from dbcp.constants import FIPS_CODE_VINTAGE
+from dbcp.transform import helpers
+from pudl.helpers import add_fips_ids
+
+
+def test_add_fips_ids_to_unique_locations():
+    """Test that looking up unique locations matches the row-by-row pudl lookup."""
+    input_df = pd.DataFrame(
+        {
+            "state": ["CO", "NY", "CO", "CO", "Not a State", np.nan, "NY"],
+            "county": [
+                "Boulder",
+                "Albany",
+                "Boulder",
+                "Denver",
+                "Boulder",
+                "Boulder",
+                "Albany",
+            ],
+            "other": range(7),
+        },
+        index=[30, 10, 60, 0, 20, 50, 40],
+    )
+    expected = add_fips_ids(
+        input_df.copy(),
+        state_col="state",
+        county_col="county",
+        vintage=FIPS_CODE_VINTAGE,
+    )
+
+    actual = helpers.add_fips_ids_to_unique_locations(
+        input_df, state_col="state", county_col="county"
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def _mock_single_pass_geocoding(
+    state_locality_df: pd.DataFrame, state_col="state", locality_col="county"
+) -> pd.DataFrame:
+    """Mock one pass of FIPS lookup + geocoding with canned results per locality."""
+    results = {
+        # county_id_fips, geocoded_locality_name, geocoded_locality_type, geocoded_containing_county
+        "Albany, Albany": ["36001", "Albany", "city", "Albany"],
+        "Houston, Houston": [np.nan, "Houston", "county", "Houston"],
+        "Houston": ["48201", "Houston", "city", "Harris"],
+        "Nowhere, Nowhere": [np.nan, "Nowhere", "city", np.nan],
+        "Nowhere": [np.nan, np.nan, np.nan, np.nan],
+    }
+    new_cols = pd.DataFrame(
+        [results[locality] for locality in state_locality_df[locality_col]],
+        index=state_locality_df.index,
+        columns=[
+            "county_id_fips",
+            "geocoded_locality_name",
+            "geocoded_locality_type",
+            "geocoded_containing_county",
+        ],
+    )
+    new_cols.insert(0, "state_id_fips", "01")
+    return pd.concat([state_locality_df, new_cols], axis=1)
+
+
+def test_add_county_fips_with_backup_geocoding_fallback_col(monkeypatch):
+    """Test that the fallback column only fills values the first pass left empty."""
+    passes = []
+
+    def mock_single_pass(state_locality_df, **kwargs):
+        passes.append(state_locality_df.index.to_list())
+        return _mock_single_pass_geocoding(state_locality_df, **kwargs)
+
+    monkeypatch.setattr(
+        helpers, "_add_county_fips_with_backup_geocoding", mock_single_pass
+    )
+    input_df = pd.DataFrame(
+        {
+            "state": ["NY", "TX", "CO"],
+            "city_county": ["Albany, Albany", "Houston, Houston", "Nowhere, Nowhere"],
+            "city": ["Albany", "Houston", "Nowhere"],
+        },
+        index=[10, 20, 30],
+    )
+    expected = pd.DataFrame(
+        {
+            "county_id_fips": ["36001", "48201", np.nan],
+            "geocoded_locality_name": ["Albany", "Houston", "Nowhere"],
+            "geocoded_locality_type": ["city", "city", "city"],
+            "geocoded_containing_county": ["Albany", "Harris", np.nan],
+        },
+        index=[10, 20, 30],
+    )
+
+    actual = helpers.add_county_fips_with_backup_geocoding(
+        input_df,
+        state_col="state",
+        locality_col="city_county",
+        fallback_locality_col="city",
+    )
+    # the fallback is only looked up for rows the first pass couldn't resolve
+    assert passes == [[10, 20, 30], [20, 30]]
+    pd.testing.assert_frame_equal(actual.loc[:, expected.columns], expected)